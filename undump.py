@@ -19,6 +19,9 @@ New in this version
   between the archive and metadata trees.
 * A ``--limit`` option allows deterministic, repeatable test runs by
   processing only the first *N* files (files are sorted alphabetically).
+* Files are processed per UUID in a pool of worker processes
+  (``--jobs``).  Name conflicts are resolved by the main process in walk
+  order, so the output does not depend on the number of workers.
 * The CLI continues to support folder/filename masks, verbosity flags,
   etc.
 
@@ -28,16 +31,32 @@ Dependencies::
 """
 from __future__ import annotations
 
+import errno
+import heapq
 import logging
+import os
 import shutil
+import string
 import sys
 import re
 import unicodedata
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
-from typing import Dict, Mapping, List
+from typing import Callable, Deque, Dict, Iterable, Iterator, Mapping, List, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
 
 import click
-from rdflib import Graph, Namespace, Literal
+from rdflib import Graph, Namespace, URIRef
 from rdflib.namespace import OWL
 
 ###############################################################################
@@ -46,6 +65,9 @@ from rdflib.namespace import OWL
 
 RDF_FNAME = "tree_non_inferred.rdf"  # change if your metadata file differs
 MAX_SEGMENT_LEN = 30                 # max characters in any path segment
+LOGGER_NAME = "cli-renamer"
+COPY_CHUNK = 1 << 30                 # max bytes per copy_file_range/sendfile call
+MAX_PENDING_PER_WORKER = 4           # UUID groups queued per worker process
 
 ###############################################################################
 # Namespaces used in Cellar RDF
@@ -54,10 +76,94 @@ MAX_SEGMENT_LEN = 30                 # max characters in any path segment
 n_CDM = Namespace("http://publications.europa.eu/ontology/cdm#")
 n_LANG = Namespace("http://publications.europa.eu/resource/authority/language/")
 
+# rdflib terms for the fallback, built once: every ``Namespace`` attribute
+# access creates a new URIRef.
+_TERM_DATE = n_CDM.date_creation_legacy
+_TERM_ELI = n_CDM.resource_legal_eli
+_TERM_TYPE = n_CDM["work_has_resource-type"]
+_TERM_CELEX = n_CDM.resource_legal_id_celex
+_TERM_YEAR = n_CDM.resource_legal_year
+_TERM_BELONGS_TO_WORK = n_CDM.expression_belongs_to_work
+_TERM_USES_LANGUAGE = n_CDM.expression_uses_language
+_TERM_TITLE = n_CDM.expression_title
+_TERM_SUBTITLE = n_CDM.expression_subtitle
+_WORK_TERMS = (_TERM_DATE, _TERM_ELI, _TERM_TYPE, _TERM_CELEX, _TERM_YEAR)
+
+
+@lru_cache(maxsize=None)
+def language_term(language: str) -> URIRef:
+    """Return the (cached) EU authority URI of a three‑letter *language*."""
+    return n_LANG[language]
+
+
+# ElementTree tags / attribute names for the streaming RDF/XML extractor
+_RDF_NS = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+_RDF_ROOT = f"{_RDF_NS}RDF"
+_RDF_ABOUT = f"{_RDF_NS}about"
+_RDF_ID = f"{_RDF_NS}ID"
+_RDF_NODEID = f"{_RDF_NS}nodeID"
+_RDF_RESOURCE = f"{_RDF_NS}resource"
+_RDF_PARSETYPE = f"{_RDF_NS}parseType"
+_XML_NS = "{http://www.w3.org/XML/1998/namespace}"
+_XML_BASE = f"{_XML_NS}base"
+# Attributes a property element may carry without describing a further node
+_PROPERTY_ELEMENT_ATTRS = frozenset(
+    (_RDF_RESOURCE, _RDF_NODEID, _RDF_ID, f"{_RDF_NS}datatype", f"{_XML_NS}lang")
+)
+
+_OWL_SAME_AS = f"{{{OWL}}}sameAs"
+_CDM_DATE = f"{{{n_CDM}}}date_creation_legacy"
+_CDM_ELI = f"{{{n_CDM}}}resource_legal_eli"
+_CDM_TYPE = f"{{{n_CDM}}}work_has_resource-type"
+_CDM_CELEX = f"{{{n_CDM}}}resource_legal_id_celex"
+_CDM_YEAR = f"{{{n_CDM}}}resource_legal_year"
+_CDM_BELONGS_TO_WORK = f"{{{n_CDM}}}expression_belongs_to_work"
+_CDM_USES_LANGUAGE = f"{{{n_CDM}}}expression_uses_language"
+_CDM_TITLE = f"{{{n_CDM}}}expression_title"
+_CDM_SUBTITLE = f"{{{n_CDM}}}expression_subtitle"
+
+_WORK_PREDICATES = (_CDM_DATE, _CDM_ELI, _CDM_TYPE, _CDM_CELEX, _CDM_YEAR)
+_WANTED_PREDICATES = frozenset(
+    (
+        _OWL_SAME_AS,
+        *_WORK_PREDICATES,
+        _CDM_BELONGS_TO_WORK,
+        _CDM_USES_LANGUAGE,
+        _CDM_TITLE,
+        _CDM_SUBTITLE,
+    )
+)
+
+
+class _UnsupportedRDF(ValueError):
+    """RDF/XML construct the streaming extractor does not model."""
+
 ###############################################################################
 # Slugification helpers
 ###############################################################################
 
+_SLUG_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _build_translit_table() -> Dict[int, str | None]:
+    """Return a ``str.translate`` table transliterating common non‑ASCII chars.
+
+    Covers Latin‑1 Supplement, Latin Extended‑A/B and General Punctuation
+    (typographic quotes, dashes, ellipsis …).  Each entry is computed with
+    the same NFKD → ASCII rule :func:`slugify` falls back to, so both paths
+    produce identical results.
+    """
+    table: Dict[int, str | None] = {}
+    for cp in (*range(0x00A0, 0x0250), *range(0x2000, 0x2070)):
+        ascii_str = unicodedata.normalize("NFKD", chr(cp)).encode("ascii", "ignore").decode("ascii")
+        table[cp] = ascii_str or None
+    return table
+
+
+_TRANSLIT_TABLE = _build_translit_table()
+
+
+@lru_cache(maxsize=8192)
 def slugify(raw: str, max_len: int = MAX_SEGMENT_LEN) -> str:
     """Return *raw* normalised for safe filesystem use.
 
@@ -67,11 +173,19 @@ def slugify(raw: str, max_len: int = MAX_SEGMENT_LEN) -> str:
     3. Trim leading/trailing punctuations ``._-``.
     4. Truncate to *max_len* characters.
     5. Provide fallback name ``unnamed`` if result empty.
+
+    Results are memoised: titles recur across the files of a UUID.
     """
-    # 1. transliterate
-    ascii_str = unicodedata.normalize("NFKD", raw).encode("ascii", "ignore").decode("ascii")
+    # 1. transliterate (nothing to do for ASCII input; otherwise table first,
+    #    NFKD only for what it does not cover)
+    if raw.isascii():
+        ascii_str = raw
+    else:
+        ascii_str = raw.translate(_TRANSLIT_TABLE)
+        if not ascii_str.isascii():
+            ascii_str = unicodedata.normalize("NFKD", ascii_str).encode("ascii", "ignore").decode("ascii")
     # 2. replace bad chars
-    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", ascii_str)
+    safe = _SLUG_RE.sub("_", ascii_str)
     # 3. strip noise
     safe = safe.strip("._-")
     # 4. length guard
@@ -83,12 +197,246 @@ def slugify(raw: str, max_len: int = MAX_SEGMENT_LEN) -> str:
 # Metadata extraction helpers
 ###############################################################################
 
-def parse_metadata(rdf_path: Path, language: str) -> Dict[str, str]:
-    """Return a dict of values extracted from *rdf_path* using SPARQL.
+def _blank(node_id: str | None) -> str | None:
+    """Return a blank‑node key for an ``rdf:nodeID`` value (``None`` passes)."""
+    return f"_:{node_id}" if node_id else None
+
+
+@dataclass(frozen=True, slots=True)
+class Metadata:
+    """Mask variables of one notice (shared by every file of its UUID)."""
+
+    year: str
+    month: str
+    day: str
+    date: str
+    title: str
+    subtitle: str
+    type: str
+    eli: str
+    celex_identifier: str
+    default_identifier: str
+
+    def as_dict(self) -> Dict[str, str]:
+        """Return the variables as a plain ``{name: value}`` dict."""
+        return {name: getattr(self, name) for name in METADATA_FIELDS}
+
+
+METADATA_FIELDS = frozenset(f.name for f in fields(Metadata))
+
+
+def _default_metadata(uuid: str) -> Metadata:
+    """Minimal defaults so the rest of the pipeline continues."""
+    return Metadata(
+        year="1970",
+        month="01",
+        day="01",
+        date="1970-01-01",
+        title="Untitled",
+        subtitle="",
+        type="UNKNOWN",
+        eli="",
+        celex_identifier="",
+        default_identifier=uuid,
+    )
+
+
+def _build_metadata(
+    uuid: str,
+    date: str,
+    title: str,
+    subtitle: str,
+    rtype: str,
+    eli: str,
+    celex_identifier: str,
+) -> Metadata:
+    """Assemble the mask variables from the raw values of a matched notice."""
+    try:
+        year, month, day = date.split("-")
+    except ValueError:
+        year, month, day = "", "", ""
+
+    return Metadata(
+        year=year,
+        month=month,
+        day=day,
+        date=date,
+        title=slugify(title),
+        subtitle=subtitle,
+        type=rtype,
+        eli=eli,
+        celex_identifier=celex_identifier,
+        default_identifier=uuid,
+    )
+
+
+_Value = tuple[str, bool]  # (URI / blank-node key / lexical form, is a resource)
+
+
+def _collect_properties(rdf_path: Path) -> Dict[str, Dict[str, List[_Value]]]:
+    """Stream *rdf_path* and return ``{subject: {predicate: [values]}}``.
+
+    Only the predicates in ``_WANTED_PREDICATES`` are kept; predicates are
+    keyed by their ElementTree tag (``{namespace}local``).  Resources are
+    stored as URIs, blank nodes as ``_:<nodeID>`` (anonymous node elements
+    get a synthetic ``_:#anon<N>`` key) and literals as their lexical form;
+    each value is flagged as resource or literal, so a literal never
+    matches a URI with the same text.
+
+    The extractor understands the flat *striped* RDF/XML written by Cellar
+    (``rdf:RDF`` → node elements → property elements).  Anything else
+    (nested node elements, ``rdf:parseType``, property attributes on a
+    property element, relative IRIs, ``xml:base`` …) raises
+    :class:`_UnsupportedRDF` so the caller can fall back to rdflib.
+    """
+    props: Dict[str, Dict[str, List[_Value]]] = {}
+    subject: str | None = None
+    anonymous = 0
+    depth = 0
+
+    for event, elem in ET.iterparse(rdf_path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if _XML_BASE in elem.attrib:
+                raise _UnsupportedRDF("xml:base")
+            if depth == 1:
+                if elem.tag != _RDF_ROOT:
+                    raise _UnsupportedRDF(f"root element {elem.tag}")
+            elif depth == 2:
+                if _RDF_ID in elem.attrib:
+                    raise _UnsupportedRDF("rdf:ID on node element")
+                subject = elem.get(_RDF_ABOUT)
+                if subject is not None and ":" not in subject:
+                    raise _UnsupportedRDF(f"relative IRI {subject!r}")
+                if subject is None:
+                    subject = _blank(elem.get(_RDF_NODEID))
+                if subject is None:
+                    # Anonymous node: '#' cannot occur in an rdf:nodeID, so
+                    # the synthetic key never clashes with a named one.
+                    anonymous += 1
+                    subject = f"_:#anon{anonymous}"
+                # Property attributes: <rdf:Description cdm:x="literal">
+                for key, value in elem.attrib.items():
+                    if key in _WANTED_PREDICATES:
+                        props.setdefault(subject, {}).setdefault(key, []).append((value, False))
+            elif depth == 3:
+                if _RDF_PARSETYPE in elem.attrib:
+                    raise _UnsupportedRDF("rdf:parseType")
+                if not _PROPERTY_ELEMENT_ATTRS.issuperset(elem.attrib):
+                    raise _UnsupportedRDF(f"property attributes on {elem.tag}")
+            else:
+                raise _UnsupportedRDF("nested node element")
+            continue
+
+        if depth == 3 and elem.tag in _WANTED_PREDICATES:
+            resource = elem.get(_RDF_RESOURCE)
+            if resource is not None:
+                if ":" not in resource:
+                    raise _UnsupportedRDF(f"relative IRI {resource!r}")
+                value = (resource, True)
+            elif _RDF_NODEID in elem.attrib:
+                value = (_blank(elem.get(_RDF_NODEID)), True)
+            else:
+                value = (elem.text or "", False)
+            props.setdefault(subject, {}).setdefault(elem.tag, []).append(value)
+        elif depth == 2:
+            elem.clear()
+        depth -= 1
+
+    return props
+
+
+def _extract_row(rdf_path: Path, root_uri: str, language_uri: str) -> Dict[str, str] | None:
+    """Resolve the metadata query against the streamed properties.
+
+    Mirrors the query pattern of :func:`_parse_metadata_rdflib`: the work is
+    any ``owl:sameAs`` alias of *root_uri* carrying every work predicate,
+    the expression is the one belonging to that work in *language_uri*.
+    Returns ``None`` when the notice holds no such match.  Extracted values
+    that are blank nodes raise :class:`_UnsupportedRDF`: rdflib renders
+    them with a generated identifier.
+    """
+    props = _collect_properties(rdf_path)
+
+    def first(values: List[_Value]) -> str:
+        value, is_resource = values[0]
+        if is_resource and value.startswith("_:"):
+            raise _UnsupportedRDF("blank node value")
+        return value
+
+    for work, is_resource in props.get(root_uri, {}).get(_OWL_SAME_AS, ()):
+        if not is_resource:
+            continue
+        work_props = props.get(work)
+        if not work_props or not all(p in work_props for p in _WORK_PREDICATES):
+            continue
+        for exp_props in props.values():
+            if (
+                (work, True) in exp_props.get(_CDM_BELONGS_TO_WORK, ())
+                and (language_uri, True) in exp_props.get(_CDM_USES_LANGUAGE, ())
+                and _CDM_TITLE in exp_props
+                and _CDM_SUBTITLE in exp_props
+            ):
+                return {
+                    "date": first(work_props[_CDM_DATE]),
+                    "eli": first(work_props[_CDM_ELI]),
+                    "rtype": first(work_props[_CDM_TYPE]),
+                    "celex_identifier": first(work_props[_CDM_CELEX]),
+                    "title": first(exp_props[_CDM_TITLE]),
+                    "subtitle": first(exp_props[_CDM_SUBTITLE]),
+                }
+    return None
+
+
+def parse_metadata(rdf_path: Path, language: str) -> Metadata:
+    """Return the :class:`Metadata` extracted from *rdf_path*.
 
     The UUID is inferred from the parent directory name, then injected
     into the `ROOT_URI` required by Cellar's Common Data Model (CDM).
-    
+
+    The notice is streamed with :func:`xml.etree.ElementTree.iterparse` and
+    only the handful of CDM predicates we need are kept, which is orders of
+    magnitude faster than building an rdflib graph.  Files that fail to
+    parse, or that use RDF/XML constructs the extractor does not model, are
+    handed to :func:`_parse_metadata_rdflib` instead.
+    """
+    uuid = rdf_path.parent.name
+    root_uri = f"http://publications.europa.eu/resource/cellar/{uuid}"
+
+    try:
+        row = _extract_row(rdf_path, root_uri, str(language_term(language)))
+    except (ET.ParseError, _UnsupportedRDF):
+        return _parse_metadata_rdflib(rdf_path, language)
+
+    if row is None:
+        return _default_metadata(uuid)
+    return _build_metadata(uuid, **row)
+
+
+def _parse_metadata_rdflib(rdf_path: Path, language: str) -> Metadata:
+    """Return the :class:`Metadata` extracted from *rdf_path* using rdflib.
+
+    Resolves the same pattern as the SPARQL query below directly against
+    the graph's triple index (``Graph.value`` / ``Graph.subjects``), which
+    avoids parsing and evaluating a query for every notice::
+
+        <ROOT_URI> owl:sameAs ?work .
+        ?work cdm:date_creation_legacy ?date ;
+              cdm:resource_legal_eli ?eli ;
+              cdm:work_has_resource-type ?type ;
+              cdm:resource_legal_id_celex ?celex_identifier ;
+              cdm:resource_legal_year ?year .
+        ?exp cdm:expression_belongs_to_work ?work ;
+             cdm:expression_uses_language lang:{language} ;
+             cdm:expression_title ?title ;
+             cdm:expression_subtitle ?subtitle .
+
+    An N‑Triples copy written by ``--convert-rdf-to-nt`` is preferred over
+    the RDF/XML notice unless it is stale: it parses much faster.  Each notice
+    gets a fresh :class:`~rdflib.Graph`: the Memory store keeps index
+    entries and prefix bindings after triples are removed, so a reused
+    store would grow with every notice in a long‑running worker.
+
     For more information on CDM or testing SPARQL queries:
         - https://op.europa.eu/en/web/eu-vocabularies/cdm
         = https://publications.europa.eu/webapi/rdf/sparql
@@ -97,68 +445,93 @@ def parse_metadata(rdf_path: Path, language: str) -> Dict[str, str]:
     root_uri = f"http://publications.europa.eu/resource/cellar/{uuid}"
 
     g = Graph()
-    # Bind namespaces for readability in possible debug prints
-    g.bind("cdm", n_CDM)
-    g.bind("lang", n_LANG)
-    g.bind("owl", OWL)
-    g.parse(rdf_path)
-
-    query = f"""
-PREFIX cdm: <http://publications.europa.eu/ontology/cdm#>
-PREFIX lang: <http://publications.europa.eu/resource/authority/language/>
-PREFIX owl: <http://www.w3.org/2002/07/owl#>
-SELECT ?date ?eli ?type ?year ?title ?subtitle ?celex_identifier WHERE {{
-    <{root_uri}> owl:sameAs ?work .
-    ?work cdm:date_creation_legacy ?date ;
-          cdm:resource_legal_eli ?eli ;
-          cdm:work_has_resource-type ?type ;
-          cdm:resource_legal_id_celex ?celex_identifier ;
-          cdm:resource_legal_year ?year .
-
-    ?exp cdm:expression_belongs_to_work ?work ;
-         cdm:expression_uses_language lang:{language} ;
-         cdm:expression_title ?title ;
-         cdm:expression_subtitle ?subtitle .
-}}
-LIMIT 1
-"""
+    nt_path = fresh_nt_sibling(rdf_path)
+    if nt_path is not None:
+        g.parse(nt_path, format="nt")
+    else:
+        g.parse(rdf_path)
+    return _lookup_metadata(g, uuid, root_uri, language)
+
+
+def _lookup_metadata(g: Graph, uuid: str, root_uri: str, language: str) -> Metadata:
+    """Resolve the metadata pattern (see :func:`_parse_metadata_rdflib`) in *g*."""
+    language_uri = language_term(language)
+    for work in g.objects(URIRef(root_uri), OWL.sameAs):
+        terms = [g.value(work, predicate) for predicate in _WORK_TERMS]
+        if None in terms:
+            continue
+        date, eli, rtype, celex_identifier, _year = map(str, terms)
+
+        for exp in g.subjects(_TERM_BELONGS_TO_WORK, work):
+            if (exp, _TERM_USES_LANGUAGE, language_uri) not in g:
+                continue
+            title = g.value(exp, _TERM_TITLE)
+            subtitle = g.value(exp, _TERM_SUBTITLE)
+            if title is None or subtitle is None:
+                continue
+            return _build_metadata(
+                uuid,
+                date=date,
+                title=str(title),
+                subtitle=str(subtitle),
+                rtype=rtype,
+                eli=eli,
+                celex_identifier=celex_identifier,
+            )
 
-    res = list(g.query(query))
-    if not res:
-        # Fallback – return minimal defaults so the rest of the pipeline continues
-        return {
-            "year": "1970",
-            "month": "01",
-            "day": "01",
-            "date": "1970-01-01",
-            "title": "Untitled",
-            "subtitle": "",
-            "type": "UNKNOWN",
-            "eli": "",
-            "celex_identifier": "",
-            "default_identifier": uuid,
-        }
-
-    row = res[0]
-    date_literal: Literal = row.date  # type: ignore[attr-defined]
-    date_str = str(date_literal)
+    return _default_metadata(uuid)
+
+
+def nt_sibling(rdf_path: Path) -> Path:
+    """Return the path of the N‑Triples copy of *rdf_path*."""
+    return rdf_path.with_suffix(".nt")
+
+
+def fresh_nt_sibling(rdf_path: Path) -> Path | None:
+    """Return the N‑Triples copy of *rdf_path* if at least as recent as it."""
+    nt_path = nt_sibling(rdf_path)
     try:
-        year, month, day = date_str.split("-")
-    except ValueError:
-        year, month, day = "", "", ""
+        if nt_path.stat().st_mtime_ns >= rdf_path.stat().st_mtime_ns:
+            return nt_path
+    except OSError:
+        pass
+    return None
+
+
+def convert_notice(rdf_path: Path) -> bool:
+    """Write the N‑Triples copy of *rdf_path*; return ``True`` if written.
+
+    Only notices the streaming extractor rejects are converted: the others
+    never reach the rdflib fallback, the only reader of the copy.  Copies at
+    least as recent as their notice are left untouched.  The copy is written
+    to a temporary file and moved into place, so an interrupted run never
+    leaves a truncated one behind.
+    """
+    if fresh_nt_sibling(rdf_path) is not None:
+        return False
+    logger = logging.getLogger(LOGGER_NAME)
+    try:
+        _collect_properties(rdf_path)
+    except (ET.ParseError, _UnsupportedRDF):
+        pass
+    except OSError:
+        logger.exception("Failed to convert %s", rdf_path)
+        return False
+    else:
+        return False
+
+    nt_path = nt_sibling(rdf_path)
+    tmp_path = nt_path.with_name(f".{nt_path.name}.{os.getpid()}.tmp")
+    try:
+        Graph().parse(rdf_path).serialize(destination=tmp_path, format="nt", encoding="utf-8")
+        os.replace(tmp_path, nt_path)
+    except Exception:  # noqa: BLE001 – an unreadable notice must not stop the run
+        tmp_path.unlink(missing_ok=True)
+        logger.exception("Failed to convert %s", rdf_path)
+        return False
+    return True
+
 
-    return {
-        "year": year,
-        "month": month,
-        "day": day,
-        "date": date_str,
-        "title": slugify(str(row.title)),          # type: ignore[attr-defined]
-        "subtitle": str(row.subtitle),    # type: ignore[attr-defined]
-        "type": str(row.type),            # type: ignore[attr-defined]
-        "eli": str(row.eli),              # type: ignore[attr-defined]
-        "celex_identifier": str(row.celex_identifier),
-        "default_identifier": uuid,
-    }
 ###############################################################################
 # Template & filesystem helpers
 ###############################################################################
@@ -173,81 +546,357 @@ def render_mask(mask: str, values: Mapping[str, str]) -> str:
     return mask.format_map(_SafeDict(values))
 
 
-def build_destination(
-    output_root: Path,
-    metadata: Mapping[str, str],
-    folder_mask: str,
-    file_mask: str,
+MaskRenderer = Callable[[Metadata], str]
+_FORMATTER = string.Formatter()
+
+
+@lru_cache(maxsize=None)
+def compile_mask(mask: str) -> MaskRenderer:
+    """Parse *mask* once and return a renderer for :class:`Metadata`.
+
+    Output is identical to :func:`render_mask` on the metadata's dict.  Plain
+    fields (``{name}``, with optional ``!conversion`` / ``:spec``) of the
+    pre‑parsed template are read directly as attributes.  Masks using
+    attribute/index access or nested specs fall back to :func:`render_mask`.
+    Raises :class:`ValueError` for malformed masks.
+    """
+    parsed = tuple(_FORMATTER.parse(mask))
+    if any(
+        field is not None and (not field.isidentifier() or "{" in spec)
+        for _literal, field, spec, _conversion in parsed
+    ):
+        return lambda values: render_mask(mask, values.as_dict())
+
+    def render(values: Metadata) -> str:
+        out = []
+        for literal, field, spec, conversion in parsed:
+            out.append(literal)
+            if field is None:
+                continue
+            value = getattr(values, field) if field in METADATA_FIELDS else f"[{field}NotFound]"
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            out.append(format(value, spec))
+        return "".join(out)
+
+    return render
+
+
+def compute_dest_dir(output_root: Path, metadata: Metadata, folder_mask: MaskRenderer) -> Path:
+    """Return the destination folder for a UUID (same for all of its files)."""
+    raw_sub = folder_mask(metadata).strip("/\\")
+    if not raw_sub:
+        return output_root
+    # Join as strings and build a single Path: its constructor normalises
+    # the separators, so there is no need to split into (and allocate per)
+    # segment.
+    return Path(os.path.join(output_root, raw_sub))
+
+
+def compute_dest_file(
+    dest_dir: Path,
+    metadata: Metadata,
+    file_mask: MaskRenderer,
     src_path: Path,
 ) -> Path:
-    raw_sub = render_mask(folder_mask, metadata).strip("/\\")
-    if raw_sub:
-        dest_dir = output_root
-        for segment in Path(raw_sub).parts:
-            #dest_dir /= slugify(segment)
-            dest_dir /= segment
-    else:
-        dest_dir = output_root
-
-    raw_stem = render_mask(file_mask, metadata).strip() or metadata.get("default_identifier") or src_path.stem
+    """Return the destination path of *src_path* inside *dest_dir*."""
+    raw_stem = file_mask(metadata).strip() or metadata.default_identifier or src_path.stem
     #file_stem = slugify(raw_stem)
     file_stem = raw_stem
 
-    return dest_dir / f"{file_stem}{src_path.suffix}"
+    return Path(os.path.join(dest_dir, file_stem + src_path.suffix))
+
+# Per-process filesystem caches: directories already created and the entry
+# names of every destination directory seen so far.
+_known_dirs: set[Path] = set()
+_dir_names: Dict[Path, set[str]] = {}
+
+
+def existing_names(directory: Path) -> set[str]:
+    """Return the cached set of entry names in *directory*.
+
+    The directory is scanned once; callers add the names they reserve so
+    the set stays current without further syscalls.  Missing directories
+    yield an empty set.
+    """
+    names = _dir_names.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as it:
+                names = {entry.name for entry in it}
+        except FileNotFoundError:
+            names = set()
+        _dir_names[directory] = names
+    return names
+
+
+def ensure_dir(directory: Path) -> None:
+    """Create *directory* (and parents) unless this process already did."""
+    if directory not in _known_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _known_dirs.add(directory)
 
-def ensure_unique_path(path: Path, fallback: str) -> Path:
-    """Return a unique *path* by appending *fallback* & counter if needed."""
+
+def ensure_unique_path(path: Path, fallback: str, names: set[str]) -> Path:
+    """Return a unique *path* by appending *fallback* & counter if needed.
+
+    Uniqueness is checked against *names* (the entries of ``path.parent``,
+    see :func:`existing_names`) only – no syscalls.  The chosen name is
+    added to *names*.
+    """
     candidate = path
     counter = 1
-    while candidate.exists():
+    while candidate.name in names:
         candidate = candidate.with_stem(f"{path.stem}_{fallback}_{counter}")
         counter += 1
+    names.add(candidate.name)
     return candidate
 
 
-def copy_with_structure(
-    src: Path,
-    archive_root: Path,
+# errno values meaning "this kernel fast path is not available here"
+_COPY_FALLBACK_ERRNOS = frozenset(
+    (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTSOCK)
+)
+_O_BINARY = getattr(os, "O_BINARY", 0)
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): share all extents of a file
+_FICLONE = 0x40049409 if fcntl is not None and sys.platform.startswith("linux") else None
+_FICLONE_FALLBACK_ERRNOS = _COPY_FALLBACK_ERRNOS | {errno.ENOTTY, errno.EBADF}
+
+# st_dev of every destination directory seen so far
+_dir_devices: Dict[Path, int] = {}
+
+
+def _device_of(directory: Path) -> int:
+    """Return the (cached) device id of *directory*."""
+    dev = _dir_devices.get(directory)
+    if dev is None:
+        dev = _dir_devices[directory] = os.stat(directory).st_dev
+    return dev
+
+
+def _copy_fd(src_fd: int, dst_fd: int, same_fs: bool, size: int) -> None:
+    """Copy from *src_fd* (*size* bytes long) to *dst_fd*, both at offset 0.
+
+    Tries ``copy_file_range`` (data never leaves the kernel; on Linux ≥ 5.3
+    same‑filesystem copies on Btrfs/XFS become reflinks), then – on the same
+    filesystem only – a ``FICLONE`` reflink, then ``sendfile``, then a
+    userspace ``copyfileobj``.  Each step continues where the previous one
+    stopped.  Some filesystems (procfs‑like, some FUSE and network ones)
+    make the kernel calls report 0 bytes without an error, so a call is
+    only trusted once its first chunk moved data.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            if os.copy_file_range(src_fd, dst_fd, COPY_CHUNK) or not size:
+                while os.copy_file_range(src_fd, dst_fd, COPY_CHUNK):
+                    pass
+                return
+        except OSError as exc:
+            if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    # A clone replaces the whole file, so only try it before any data moved.
+    if same_fs and _FICLONE is not None and os.lseek(dst_fd, 0, os.SEEK_CUR) == 0:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError as exc:
+            if exc.errno not in _FICLONE_FALLBACK_ERRNOS:
+                raise
+
+    if hasattr(os, "sendfile"):
+        try:
+            if os.sendfile(dst_fd, src_fd, None, COPY_CHUNK) or not size:
+                while os.sendfile(dst_fd, src_fd, None, COPY_CHUNK):
+                    pass
+                return
+        except OSError as exc:
+            if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    with open(src_fd, "rb", closefd=False) as fsrc, open(dst_fd, "wb", closefd=False) as fdst:
+        shutil.copyfileobj(fsrc, fdst)
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy *src* to a new file *dst* with permission bits and timestamps.
+
+    Replacement for :func:`shutil.copy2` that keeps the data path in kernel
+    space (see :func:`_copy_fd`) and restores metadata from a single
+    ``fstat`` of the source.  Extended attributes and file flags are not
+    copied.  *dst* is opened with ``O_CREAT | O_EXCL``: an existing file
+    (or a symlink planted there) raises :class:`FileExistsError` rather
+    than being overwritten.
+    """
+    src_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+    try:
+        st = os.fstat(src_fd)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o666)
+        try:
+            _copy_fd(src_fd, dst_fd, st.st_dev == _device_of(dst.parent), st.st_size)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    os.chmod(dst, st.st_mode & 0o7777)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def iter_files(root: str) -> Iterator[str]:
+    """Yield the path of every file below *root*, lazily.
+
+    Walks the tree with :func:`os.scandir`, whose entries carry the file
+    type from the directory listing, so no extra ``stat`` is needed per
+    entry.  Entries are visited in name order within each directory, which
+    makes the walk deterministic without a global sort.  Symlinked
+    directories are not descended into; unreadable ones are skipped with a
+    warning.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except PermissionError:
+        logging.getLogger(LOGGER_NAME).warning("Cannot read directory %s, skipping", root)
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_files(entry.path)
+        elif entry.is_file():
+            yield entry.path
+
+
+def archive_uuid(path: Path, archive_root: Path) -> str:
+    """Return the UUID segment of *path* (first segment after *archive_root*)."""
+    return path.relative_to(archive_root).parts[0]
+
+
+def copy_with_structure(src: Path, target: Path, logger: logging.Logger) -> None:
+    """Copy *src* to its reserved *target* (see :func:`reserve_destinations`)."""
+    ensure_dir(target.parent)
+    _fast_copy(src, target)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Copied %s → %s", src, target)
+
+
+Plan = List[tuple[Path, Path]]  # (source, destination) pairs of one UUID
+Reservation = List[tuple[Path, Path, Path]]  # (source, destination, reserved target)
+T = TypeVar("T")
+
+
+def plan_group(
+    uuid: str,
+    sources: List[Path],
     output_root: Path,
     metadata_root: Path,
     folder_mask: str,
     file_mask: str,
     language: str,
-    logger: logging.Logger,
-):
-    """Process a single *src* file: find RDF, compute target path, copy."""
+) -> Plan:
+    """Return the wanted destination of every file of one *uuid*.
 
-    # Derive UUID from archive path (first segment after archive_root)
-    logger.debug("Applying folder and file mask %s and %s", folder_mask, file_mask)
-    try:
-        uuid = src.relative_to(archive_root).parts[0]
-    except ValueError:
-        logger.warning("Could not determine UUID for %s", src)
-        return
-    logger.debug("Found UUID  %s", uuid)
+    This is the expensive half of a UUID, handed to the process pool.  The
+    RDF notice is parsed and the destination folder computed once for the
+    whole UUID; only the file name is derived per file.  Nothing is written
+    and names are not de‑duplicated here: :func:`reserve_destinations` does
+    that in the parent, in walk order, so the result does not depend on
+    which worker finishes first.  Skipped or failing files are left out.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Found UUID  %s", uuid)
 
     rdf_path = metadata_root / uuid / RDF_FNAME
     if not rdf_path.is_file():
-        logger.warning("No RDF for %s (expected %s)", src.name, rdf_path)
-        return
-    logger.debug("Found matching rdf %s", rdf_path)
+        logger.warning("No RDF for UUID %s (expected %s), skipping %d file(s)", uuid, rdf_path, len(sources))
+        return []
+
+    try:
+        metadata = parse_metadata(rdf_path, language)
+    except Exception:  # noqa: BLE001 – broad except acceptable for CLI
+        logger.error("Failed to process %s", rdf_path, exc_info=logger.isEnabledFor(logging.INFO))
+        return []
+    if debug:
+        logger.debug("Found matching rdf %s: %r", rdf_path, metadata)
+        logger.debug("Applying folder and file mask %s and %s", folder_mask, file_mask)
+
+    try:
+        dest_dir = compute_dest_dir(output_root, metadata, compile_mask(folder_mask))
+        render_file = compile_mask(file_mask)
+    except Exception:  # noqa: BLE001 – broad except acceptable for CLI
+        exc_info = logger.isEnabledFor(logging.INFO)
+        for src in sources:
+            logger.error("Failed to process %s", src, exc_info=exc_info)
+        return []
+
+    plan: Plan = []
+    for src in sources:
+        try:
+            plan.append((src, compute_dest_file(dest_dir, metadata, render_file, src)))
+        except Exception:  # noqa: BLE001 – broad except acceptable for CLI
+            logger.error("Failed to process %s", src, exc_info=logger.isEnabledFor(logging.INFO))
+    return plan
+
+
+def reserve_destinations(uuid: str, plan: Plan, logger: logging.Logger) -> Reservation:
+    """Return *plan* with a unique target for every destination (appending *uuid*).
+
+    Only ever called by the main process, one UUID at a time in walk
+    order: it is the single owner of the destination name snapshots, which
+    keeps conflict resolution deterministic whatever ``--jobs`` is.
+    """
+    reserved: Reservation = []
+    for src, dest_path in plan:
+        target = ensure_unique_path(dest_path, uuid, existing_names(dest_path.parent))
+        if target != dest_path:
+            logger.warning("Conflict: %s exists – appending default identifier", dest_path.name)
+        reserved.append((src, dest_path, target))
+    return reserved
+
+
+def copy_group(uuid: str, reserved: Reservation) -> int:
+    """Copy every source to its reserved target; return the number copied.
+
+    A target that turns out to exist anyway (an alias on a case‑insensitive
+    filesystem, a file written by another program) is added to the name
+    snapshot and the next ``_{uuid}_{n}`` candidate is tried.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    copied = 0
+    for src, dest_path, target in reserved:
+        try:
+            while True:
+                try:
+                    copy_with_structure(src, target, logger)
+                    break
+                except FileExistsError:
+                    names = existing_names(target.parent)
+                    names.add(target.name)
+                    logger.warning("Conflict: %s exists – appending default identifier", target.name)
+                    target = ensure_unique_path(dest_path, uuid, names)
+        except Exception:  # noqa: BLE001 – broad except acceptable for CLI
+            logger.error("Failed to process %s", src, exc_info=logger.isEnabledFor(logging.INFO))
+        else:
+            copied += 1
+    return copied
+
 
-    metadata = parse_metadata(rdf_path, language)
-    logger.debug(metadata)
-    dest_path = build_destination(
-            output_root, 
-            metadata, 
-            folder_mask, 
-            file_mask, 
-            src)
+def _task_result(future: Future[T], default: T, what: str, logger: logging.Logger) -> T:
+    """Return the result of a finished pool task, *default* if it died."""
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        logger.error("Worker process died, %s lost", what)
+        return default
+    except Exception:  # noqa: BLE001 – a dead worker must not stop the run
+        logger.exception("Worker failed for %s", what)
+        return default
 
-    if dest_path.exists():
-        logger.warning("Conflict: %s exists – appending default identifier", dest_path.name)
-        dest_path = ensure_unique_path(dest_path, uuid)
 
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dest_path)
-    logger.debug("Copied %s → %s", src, dest_path)
+def _configure_logging(level: int) -> None:
+    """Set up stderr logging; also used as process pool initializer."""
+    logging.basicConfig(level=level, format="%(levelname)s: %(message)s", stream=sys.stderr)
 
 ###############################################################################
 # CLI definition
@@ -282,6 +931,19 @@ def copy_with_structure(
     show_default=True,
     help="Language of metadata values to be retrieved (Three letters, default ENG)",
 )
+@click.option(
+    "--convert-rdf-to-nt",
+    is_flag=True,
+    help="First write an N‑Triples copy of notices that need the (slower) rdflib fallback.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    metavar="N",
+    help="Number of worker processes (default: number of CPUs). 1 → sequential.",
+)
 @click.option("-v", "--verbose", count=True, help="Increase log verbosity (-v / -vv).")
 @click.version_option(package_name="cli-renamer", prog_name="cli-renamer")
 def main(
@@ -292,6 +954,8 @@ def main(
     file_mask: str,
     limit: int | None,
     language: str,
+    convert_rdf_to_nt: bool,
+    jobs: int | None,
     verbose: int,
 ):
 
@@ -303,35 +967,140 @@ def main(
     """
 
     log_lvl = logging.WARNING - (10 * min(verbose, 2))
-    logging.basicConfig(level=log_lvl, format="%(levelname)s: %(message)s", stream=sys.stderr)
-    logger = logging.getLogger("cli-renamer")
+    _configure_logging(log_lvl)
+    logger = logging.getLogger(LOGGER_NAME)
 
-    # Gather and sort archive files deterministically
-    files: List[Path] = sorted(
-        (p for p in archive_dir.rglob("*") if p.is_file()),
-        key=lambda p: p.as_posix(),
-    )
+    # Masks are compiled (and cached) again in each worker: closures do not
+    # cross process boundaries.  Compiling and rendering each mask once here
+    # reports bad masks (syntax, positional fields, format specs) up front.
+    sample = _default_metadata("")
+    for name, mask in (("--folder-mask", folder_mask), ("--file-mask", file_mask)):
+        try:
+            compile_mask(mask)(sample)
+        except (ValueError, IndexError, KeyError, AttributeError) as exc:
+            raise click.BadParameter(str(exc), param_hint=name) from exc
+
+    workers = jobs or os.cpu_count() or 1
+
+    if convert_rdf_to_nt:
+        notices = [
+            rdf_path
+            for rdf_path in (Path(e.path) / RDF_FNAME for e in os.scandir(metadata_dir) if e.is_dir())
+            if rdf_path.is_file()
+        ]
+        logger.info("Converting %d notice(s) to N‑Triples…", len(notices))
+        if workers == 1:
+            converted = sum(map(convert_notice, notices))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_configure_logging, initargs=(log_lvl,)
+            ) as pool:
+                converted = sum(pool.map(convert_notice, notices, chunksize=32))
+        logger.info("Converted %d notice(s)", converted)
+
+    # Files are streamed from the walk, which visits each UUID directory in
+    # name order, so groups come out contiguous and nothing is materialised.
+    # --limit keeps the alphabetically first N paths with a bounded heap.
+    def uuid_of(p: Path) -> str:
+        return archive_uuid(p, archive_dir)
+
+    paths = iter_files(os.fspath(archive_dir))
+    files: Iterable[Path]
     if limit is not None and limit > 0:
-        files = files[:limit]
         logger.info("Test mode: limiting to %d files", limit)
+        files = sorted(map(Path, heapq.nsmallest(limit, paths)), key=uuid_of)
+    else:
+        files = map(Path, paths)
 
-    logger.info("Processing %d file(s)…", len(files))
+    # One UUID group is one task, so a notice is never parsed twice.  UUIDs
+    # without a metadata folder are dropped here, before any task is built.
+    with os.scandir(metadata_dir) as it:
+        valid_uuids = {entry.name for entry in it if entry.is_dir()}
 
-    for path in files:
-        try:
-            copy_with_structure(
-                src=path,
-                archive_root=archive_dir,
-                output_root=output_dir,
-                metadata_root=metadata_dir,
-                folder_mask=folder_mask,
-                file_mask=file_mask,
-                language=language,
-                logger=logger,
-            )
-        except Exception:  # noqa: BLE001 – broad except acceptable for CLI
-            logger.exception("Failed to process %s", path)
+    def with_metadata(groups: Iterable[tuple[str, List[Path]]]) -> Iterator[tuple[str, List[Path]]]:
+        for uuid, sources in groups:
+            if uuid in valid_uuids:
+                yield uuid, sources
+            else:
+                logger.warning("No metadata folder for UUID %s, skipping %d file(s)", uuid, len(sources))
+
+    groups = with_metadata((uuid, list(group)) for uuid, group in groupby(files, key=uuid_of))
+    options = dict(
+        output_root=output_dir,
+        metadata_root=metadata_dir,
+        folder_mask=folder_mask,
+        file_mask=file_mask,
+        language=language,
+    )
+
+    def process_group(uuid: str, sources: List[Path]) -> int:
+        plan = plan_group(uuid, sources, **options)
+        count = copy_group(uuid, reserve_destinations(uuid, plan, logger))
+        if plan:
+            logger.info("Finished UUID %s (%d file(s))", uuid, count)
+        return count
+
+    logger.info("Processing files…")
+    copied = 0
+    if workers > 1:
+        logger.info("Using %d worker process(es)", workers)
+        max_pending = workers * MAX_PENDING_PER_WORKER
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_configure_logging, initargs=(log_lvl,)
+        ) as pool:
+            # Plans are collected in submission (= walk) order, whatever the
+            # order workers finish in, so names are reserved deterministically.
+            # Both queues are bounded so the walk stays lazy.
+            planning: Deque[tuple[str, Future[Plan]]] = deque()
+            copying: Dict[Future[int], str] = {}
+
+            def collect(finished: Iterable[Future[int]]) -> None:
+                nonlocal copied
+                for done in finished:
+                    uuid = copying.pop(done)
+                    count = _task_result(done, None, f"UUID {uuid}", logger)
+                    if count is not None:
+                        copied += count
+                        logger.info("Finished UUID %s (%d file(s))", uuid, count)
+
+            def reserve_oldest() -> None:
+                nonlocal copied
+                uuid, future = planning.popleft()
+                reserved = reserve_destinations(uuid, _task_result(future, [], f"UUID {uuid}", logger), logger)
+                if not reserved:
+                    return
+                try:
+                    copying[pool.submit(copy_group, uuid, reserved)] = uuid
+                except BrokenProcessPool:
+                    count = copy_group(uuid, reserved)
+                    copied += count
+                    logger.info("Finished UUID %s (%d file(s))", uuid, count)
+                if len(copying) >= max_pending:
+                    collect(wait(copying, return_when=FIRST_COMPLETED)[0])
+
+            # A worker that dies (OOM kill, crash in a C extension) breaks the
+            # pool: its in-flight tasks are lost and logged, the groups not
+            # yet submitted are left to the sequential loop below.
+            for uuid, sources in groups:
+                try:
+                    planning.append((uuid, pool.submit(plan_group, uuid, sources, **options)))
+                except BrokenProcessPool:
+                    logger.error("Worker pool broken, processing the remaining UUIDs sequentially")
+                    while planning:
+                        reserve_oldest()
+                    copied += process_group(uuid, sources)
+                    break
+                if len(planning) >= max_pending:
+                    reserve_oldest()
+            while planning:
+                reserve_oldest()
+            collect(as_completed(list(copying)))
+
+    # Sequential run (-j1), or what is left of the walk after a broken pool.
+    for uuid, sources in groups:
+        copied += process_group(uuid, sources)
 
+    logger.info("Copied %d file(s)", copied)
     logger.info("Done.")
 
 